@@ -0,0 +1,106 @@
+from typing import Callable, Iterator
+
+import argparse
+import json
+import statistics
+import time
+
+import pydantic
+import pydantic_core
+
+from stac_fastapi.static.core.lib.json_key_scanner import JsonKeyScanner
+
+parser = argparse.ArgumentParser(description="Benchmarks item id extraction against document size and id key position")
+parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50, 100, 300], help="Document sizes (KB)")
+parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measure")
+parser.add_argument("--chunk-size", type=int, default=16 * 1024, help="Chunk size (bytes) of the streaming extractor")
+parser.add_argument("--legacy-max-size", type=int, default=10, help="Largest document size (KB) the legacy extractor is run on")
+
+args = parser.parse_args()
+
+
+class IdObject(pydantic.BaseModel):
+
+    id: str = pydantic.Field(..., alias="id", min_length=1)
+
+
+def make_item(size: int, id_position: str) -> bytes:
+    # A feature with a large linestring geometry, the id is placed before or after it
+    n_points = max(1, size * 1024 // 18)
+    geometry = {
+        "type": "LineString",
+        "coordinates": [[-180 + (i % 3600) / 10, -90 + (i % 1800) / 10] for i in range(n_points)]
+    }
+    item = {"type": "Feature", "stac_version": "1.1.0"}
+
+    if id_position == "first":
+        item = {**item, "id": "item-id", "geometry": geometry}
+    else:
+        item = {**item, "geometry": geometry, "id": "item-id"}
+
+    return json.dumps({**item, "properties": {"datetime": "2025-01-01T00:00:00Z"}}).encode()
+
+
+def iter_content(content: bytes, chunk_size: int) -> Iterator[bytes]:
+    for i in range(0, len(content), chunk_size):
+        yield content[i:i + chunk_size]
+
+
+def legacy_extract_id(content: bytes) -> str:
+    # Previous implementation : byte per byte, reparsing the partial document after every byte
+    buffer = b""
+
+    for chunk in iter_content(content, 1):
+        buffer += chunk
+        try:
+            return IdObject.model_validate(pydantic_core.from_json(buffer, allow_partial=True)).id
+        except pydantic.ValidationError:
+            pass
+
+    return IdObject.model_validate_json(buffer).id
+
+
+def streaming_extract_id(content: bytes) -> str:
+    scanner = JsonKeyScanner("id")
+
+    for chunk in iter_content(content, args.chunk_size):
+        if (id := scanner.feed(chunk)) is not None:
+            return id
+
+    raise ValueError("Missing id")
+
+
+def full_parse_extract_id(content: bytes) -> str:
+    return IdObject.model_validate_json(content).id
+
+
+def measure(extract_id: Callable[[bytes], str], content: bytes) -> float:
+    times = []
+
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        assert extract_id(content) == "item-id"
+        times.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(times)
+
+
+extractors = {
+    "legacy": legacy_extract_id,
+    "full parse": full_parse_extract_id,
+    "streaming": streaming_extract_id,
+}
+
+print(f"{'size':>8} {'id':>6} " + " ".join(f"{name:>12}" for name in extractors))
+
+for size in args.sizes:
+    for id_position in ("first", "last"):
+        content = make_item(size, id_position)
+
+        times = [
+            f"{measure(extract_id, content):10.3f}ms" if name != "legacy" or size <= args.legacy_max_size else f"{'-':>12}"
+            for (name, extract_id)
+            in extractors.items()
+        ]
+
+        print(f"{len(content) // 1024:>6}KB {id_position:>6} " + " ".join(times))
@@ -1,12 +1,14 @@
 from typing import (
     Literal,
     Union,
-    List
+    List,
+    Optional
 )
 
 from pydantic import (
     field_validator,
     PositiveInt,
+    NonNegativeInt,
     Field
 )
 
@@ -101,6 +103,26 @@ class Settings(ApiSettings):
         )
     )
 
+    fetch_id_range_size: Optional[PositiveInt] = Field(
+        None,
+        description=(
+            "When set, item ids are read from the first `fetch_id_range_size` bytes of remotely hosted items"
+            " (using an HTTP `Range` request), the whole item is only fetched if its id could not be found in that range."
+            " Items ids are usually found at the very start of the document, whereas geometries can weigh hundreds of KB."
+            " This option is ignored when the underlying catalog is locally hosted (`file://`)."
+        )
+    )
+
+    walk_lookahead: NonNegativeInt = Field(
+        0,
+        description=(
+            "Number of upcoming sibling catalogs, collections and items fetched concurrently (in a background thread pool)"
+            " while the current one is being filtered. Prefetches of skipped branches are dropped."
+            " Mostly useful with remotely hosted catalogs where each fetch is a network round-trip."
+            " `0` disables prefetching."
+        )
+    )
+
     cache: bool = Field(
         True,
         description=(
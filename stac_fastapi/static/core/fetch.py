@@ -7,7 +7,6 @@ import requests
 from requests import HTTPError
 
 import pydantic
-import pydantic_core
 
 from stac_pydantic.catalog import Catalog
 from stac_pydantic.collection import Collection
@@ -18,6 +17,7 @@ from stac_pydantic.shared import MimeTypes
 from .errors import (
     BadStacObjectError
 )
+from .lib.json_key_scanner import JsonKeyScanner
 from .model import (
     get_self_href,
     set_self_href,
@@ -29,39 +29,50 @@ from .requests import (
 )
 
 
-class IdObject(pydantic.BaseModel):
-
-    id: str = pydantic.Field(..., alias="id", min_length=1)
-
-
-def fetch_id(href: str, *, session: requests.Session = Session(), assume_best_practice_layout: bool = False) -> str:
+def fetch_id(
+    href: str,
+    *,
+    session: requests.Session = Session(),
+    assume_best_practice_layout: bool = False,
+    chunk_size: int = 16 * 1024,
+    range_size: Optional[int] = None
+) -> str:
     if assume_best_practice_layout:
         id = guess_id_from_href(href)
         if id is not None:
             return id
 
-    with session.get(href, stream=True) as response:
+    if range_size and not is_file_uri(href):
+        headers = {"Range": f"bytes=0-{range_size - 1}"}
+    else:
+        headers = None
+
+    with session.get(href, stream=True, headers=headers) as response:
         response.raise_for_status()
 
-        content = b""
+        is_partial = response.status_code == 206
+        scanner = JsonKeyScanner("id")
 
-        for content_chunk in response.iter_content():
-            content += content_chunk
+        for content_chunk in response.iter_content(chunk_size):
             try:
-                result = IdObject.model_validate(
-                    pydantic_core.from_json(content, allow_partial=True)
-                )
-            except pydantic.ValidationError as error:
-                pass
+                id = scanner.feed(content_chunk)
             except ValueError as error:
                 raise BadStacObjectError(f"Bad JSON : {href}", href=href) from error
-            else:
-                return result.id
 
-        try:
-            return IdObject.model_validate_json(content).id
-        except pydantic.ValidationError as error:
-            raise BadStacObjectError(f"Not a STAC object : {href}", href=href) from error
+            if id is not None:
+                if not id:
+                    raise BadStacObjectError(f"Not a STAC object : {href}", href=href)
+
+                return id
+
+    if is_partial:
+        return fetch_id(
+            href,
+            session=session,
+            chunk_size=chunk_size
+        )
+
+    raise BadStacObjectError(f"Not a STAC object : {href}", href=href)
 
 
 def fetch_walkable(href: str, *, session: requests.Session = Session(), assume_absolute_hrefs: bool = False) -> Collection | Catalog:
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from typing import (
+    Optional
+)
+
+import re
+import json
+
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRING_CONTENT = re.compile(rb"(?:[^\"\\]|\\.)*", re.DOTALL)
+_NESTED_CONTENT = re.compile(rb"[^\"{}]*")
+
+
+class JsonKeyScanner():
+    # Incremental (chunk by chunk) extraction of a top-level string member of a JSON object.
+    # Only the current top-level key or value is buffered, nested values are skipped without being parsed.
+
+    key: bytes
+
+    _max_key_size: int
+    _max_value_size: int
+
+    _buffer: bytes
+    _depth: int
+    _state: str
+    _string: bytearray | None
+    _string_max_size: int
+    _string_overflow: bool
+    _is_key_match: bool
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        max_value_size: int = 64 * 1024
+    ):
+        self.key = json.dumps(key).encode()[1:-1]
+
+        self._max_key_size = len(self.key)
+        self._max_value_size = max_value_size
+
+        self._buffer = b""
+        self._depth = 0
+        self._state = "start"
+        self._string = None
+        self._string_max_size = 0
+        self._string_overflow = False
+        self._is_key_match = False
+
+    def feed(self, chunk: bytes) -> Optional[str]:
+        data = self._buffer + chunk if self._buffer else chunk
+        self._buffer = b""
+
+        position = 0
+        end = len(data)
+
+        while position < end:
+            state = self._state
+
+            if state in ("key", "value", "skip_value", "skip_string"):
+                match = _STRING_CONTENT.match(data, position)
+                content_end = match.end()
+
+                if content_end < end and data[content_end] == 0x5C:
+                    # Escape sequence split across chunks
+                    self._buffer = data[content_end:]
+                    self._append_string(data[position:content_end])
+                    return None
+
+                self._append_string(data[position:content_end])
+
+                if content_end == end:
+                    return None
+
+                position = content_end + 1
+
+                if state == "key":
+                    self._is_key_match = not self._string_overflow and bytes(self._string) == self.key
+                    self._state = "colon"
+                elif state == "value":
+                    if self._string_overflow:
+                        raise ValueError("Top-level member value exceeds the maximum size")
+
+                    return json.loads(b"\"" + bytes(self._string) + b"\"")
+                elif state == "skip_value":
+                    self._state = "comma"
+                else:
+                    self._state = "nested"
+
+                self._string = None
+                continue
+
+            if state == "nested":
+                match = _NESTED_CONTENT.match(data, position)
+                content = data[position:match.end()]
+
+                self._depth += content.count(b"[") - content.count(b"]")
+                position = match.end()
+
+                if self._depth == 1:
+                    self._state = "key_or_end" if content.rstrip().endswith(b",") else "comma"
+                    continue
+
+                if position == end:
+                    return None
+
+                char = data[position]
+                position += 1
+
+                if char == 0x22:  # "
+                    self._start_string(skip=True)
+                    self._state = "skip_string"
+                elif char == 0x7B:  # {
+                    self._depth += 1
+                elif char == 0x7D:  # }
+                    self._depth -= 1
+
+                    if self._depth == 1:
+                        self._state = "comma"
+
+                continue
+
+            position = _WHITESPACE.match(data, position).end()
+
+            if position == end:
+                return None
+
+            char = data[position]
+            position += 1
+
+            if state == "start":
+                if char == 0x7B:  # {
+                    self._depth = 1
+                    self._state = "key_or_end"
+                else:
+                    raise ValueError("Not a JSON object")
+            elif state == "key_or_end":
+                if char == 0x22:  # "
+                    self._start_string(max_size=self._max_key_size)
+                    self._state = "key"
+                elif char == 0x7D:  # }
+                    self._state = "done"
+                else:
+                    raise ValueError(f"Unexpected character {chr(char)!r}, expected a key")
+            elif state == "colon":
+                if char == 0x3A:  # :
+                    self._state = "value_start"
+                else:
+                    raise ValueError(f"Unexpected character {chr(char)!r}, expected ':'")
+            elif state == "value_start":
+                if char == 0x22:  # "
+                    if self._is_key_match:
+                        self._start_string(max_size=self._max_value_size)
+                        self._state = "value"
+                    else:
+                        self._start_string(skip=True)
+                        self._state = "skip_value"
+                elif self._is_key_match:
+                    raise ValueError("Top-level member is not a string")
+                elif char in (0x7B, 0x5B):  # { [
+                    self._depth += 1
+                    self._state = "nested"
+                else:
+                    self._state = "comma"
+            elif state == "comma":
+                if char == 0x2C:  # ,
+                    self._state = "key_or_end"
+                elif char == 0x7D:  # }
+                    self._state = "done"
+                # Remaining characters of a scalar value (number, true, false, null)
+            elif state == "done":
+                raise ValueError("Trailing data after the JSON object")
+
+        return None
+
+    def _start_string(self, *, max_size: int = 0, skip: bool = False):
+        self._string = None if skip else bytearray()
+        self._string_overflow = False
+        self._string_max_size = max_size
+
+    def _append_string(self, content: bytes):
+        if self._string is None or self._string_overflow:
+            return
+
+        if len(self._string) + len(content) > self._string_max_size:
+            self._string_overflow = True
+            self._string = bytearray()
+        else:
+            self._string += content
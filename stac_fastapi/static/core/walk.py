@@ -5,6 +5,7 @@ from typing import (
 )
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from stac_pydantic.collection import Collection
 from stac_pydantic.item import Item
@@ -26,6 +27,20 @@ from .model import (
 
 logger = logging.getLogger(__name__)
 
+_prefetch_executor: ThreadPoolExecutor | None = None
+
+
+def _get_prefetch_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _prefetch_executor
+
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="walk_prefetch"
+        )
+
+    return _prefetch_executor
+
 
 class SkipWalk(StopIteration):
     pass
@@ -97,16 +112,31 @@ def walk(
         key=lambda link: link.walk_path
     )
 
-    for walk_result in walk_results:
-        try:
-            yield walk_result
-        except SkipWalk:
-            yield None
-            continue
-
-        if walk_result.type == (Collection, Catalog) or walk_result.type in (Collection, Catalog):
-            yield from walk(
-                walk_result,
-                session=session,
-                settings=settings
-            )
+    lookahead = settings.walk_lookahead
+    executor = _get_prefetch_executor(lookahead) if lookahead else None
+
+    i = 0
+
+    try:
+        for (i, walk_result) in enumerate(walk_results):
+            if executor is not None:
+                for next_walk_result in walk_results[i + 1:i + lookahead + 1]:
+                    next_walk_result.prefetch(executor)
+
+            try:
+                yield walk_result
+            except SkipWalk:
+                walk_result.cancel_prefetch()
+                yield None
+                continue
+
+            if walk_result.type == (Collection, Catalog) or walk_result.type in (Collection, Catalog):
+                yield from walk(
+                    walk_result,
+                    session=session,
+                    settings=settings
+                )
+    finally:
+        if executor is not None:
+            for walk_result in walk_results[i + 1:]:
+                walk_result.cancel_prefetch()
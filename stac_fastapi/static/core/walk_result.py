@@ -13,6 +13,7 @@ from typing import (
 import dataclasses
 import time
 import http
+from concurrent.futures import Executor, Future, CancelledError
 
 
 from stac_pydantic.collection import Collection
@@ -42,6 +43,8 @@ from .walk_path import WalkPath
 class WalkSettings:
     assume_absolute_hrefs: bool
     assume_best_practice_layout: bool
+    fetch_id_range_size: Optional[int]
+    walk_lookahead: int
 
 
 class CachedWalkResult(NamedTuple):
@@ -92,6 +95,7 @@ class WalkResult(Generic[T]):
     object: Optional[T] = None
 
     _resolution_time: Optional[float] = None
+    _prefetched: Optional[Future[T]] = dataclasses.field(default=None, compare=False, repr=False)
 
     def __post_init__(self):
         if self.is_resolved():
@@ -109,6 +113,37 @@ class WalkResult(Generic[T]):
     def resolution_time(self):
         return self._resolution_time
 
+    def _fetch(self) -> T:
+        try:
+            if self.type == Item:
+                return fetch_item(
+                    self.href,
+                    session=self._session,
+                    assume_absolute_hrefs=self._settings.assume_absolute_hrefs
+                )
+            else:
+                return fetch_walkable(
+                    self.href,
+                    session=self._session,
+                    assume_absolute_hrefs=self._settings.assume_absolute_hrefs
+                )
+        except HTTPError as error:
+            raise BadWalkResultError(
+                f"Network Error : {self.href} : {error.response.status_code} - {http.HTTPStatus(error.response.status_code).phrase}") from error
+        except BadStacObjectError as error:
+            raise BadWalkResultError(str(error)) from error
+
+    def prefetch(self, executor: Executor):
+        if self.is_resolved() or self._prefetched is not None:
+            return
+
+        self._prefetched = executor.submit(self._fetch)
+
+    def cancel_prefetch(self):
+        if self._prefetched is not None:
+            self._prefetched.cancel()
+            self._prefetched = None
+
     def resolve(
         self,
         *,
@@ -118,32 +153,19 @@ class WalkResult(Generic[T]):
             return self.object
 
         t_start = time.time()
-        if self.type == Item:
+
+        if self._prefetched is not None and not force:
+            (prefetched, self._prefetched) = (self._prefetched, None)
+
             try:
-                self.object = fetch_item(
-                    self.href,
-                    session=self._session,
-                    assume_absolute_hrefs=self._settings.assume_absolute_hrefs
-                )
-                self.type = Item
-            except HTTPError as error:
-                raise BadWalkResultError(
-                    f"Network Error : {self.href} : {error.response.status_code} - {http.HTTPStatus(error.response.status_code).phrase}") from error
-            except BadStacObjectError as error:
-                raise BadWalkResultError(str(error)) from error
+                self.object = prefetched.result()
+            except CancelledError:
+                self.object = self._fetch()
         else:
-            try:
-                self.object = fetch_walkable(
-                    self.href,
-                    session=self._session,
-                    assume_absolute_hrefs=self._settings.assume_absolute_hrefs
-                )
-                self.type = type(self.object)
-            except HTTPError as error:
-                raise BadWalkResultError(
-                    f"Network Error : {self.href} : {error.response.status_code} - {http.HTTPStatus(error.response.status_code).phrase}") from error
-            except BadStacObjectError as error:
-                raise BadWalkResultError(str(error)) from error
+            self.cancel_prefetch()
+            self.object = self._fetch()
+
+        self.type = type(self.object)
 
         self._cache.set(self.object.id, self)
         self._resolution_time = (time.time() - t_start) * 1000
@@ -155,15 +177,16 @@ class WalkResult(Generic[T]):
         *,
         force: bool = False
     ) -> str:
-        if self.is_resolved() and not force:
-            return self.object.id
+        if (self.is_resolved() or self._prefetched is not None) and not force:
+            return self.resolve().id
 
         if self.type == Item:
             try:
                 id = fetch_id(
                     self.href,
                     session=self._session,
-                    assume_best_practice_layout=self._settings.assume_best_practice_layout
+                    assume_best_practice_layout=self._settings.assume_best_practice_layout,
+                    range_size=self._settings.fetch_id_range_size
                 )
             except HTTPError as error:
                 raise BadWalkResultError(
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from stac_fastapi.static.core.lib.json_key_scanner import JsonKeyScanner
+
+
+def scan(document: bytes, chunk_size: int, key: str = "id") -> str | None:
+    scanner = JsonKeyScanner(key)
+
+    for i in range(0, len(document), chunk_size):
+        if (value := scanner.feed(document[i:i + chunk_size])) is not None:
+            return value
+
+    return None
+
+
+documents = [
+    {"type": "Feature", "id": "simple"},
+    {
+        "geometry": {"type": "Polygon", "coordinates": [[[0.5, 1e3], [2, -3], [0.5, 1e3]]]},
+        "properties": {"id": "nested", "title": "Braces { and [ in a string"},
+        "links": [{"id": "in-a-list", "rel": "self"}],
+        "flags": [True, False, None],
+        "escaped": "a \" quote and a \\ backslash",
+        "id": "after-geometry"
+    },
+    {"id": "uniécode \"quoted\""},
+]
+
+
+@pytest.mark.parametrize("document", documents)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 16, 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_scan_top_level_id(document: dict, chunk_size: int, indent: int | None):
+    content = json.dumps(document, indent=indent, ensure_ascii=False).encode()
+
+    assert scan(content, chunk_size) == document["id"]
+
+
+def test_scan_early_exit():
+    scanner = JsonKeyScanner("id")
+
+    assert scanner.feed(b'{"id": "early", "geometry": {"coordinates": [[') == "early"
+
+
+def test_scan_missing_id():
+    assert scan(json.dumps({"properties": {"id": "nested"}}).encode(), 4) is None
+
+
+@pytest.mark.parametrize("document", [b'["id"]', b'{"id": 1}', b'{"id" "missing colon"}'])
+def test_scan_bad_json(document: bytes):
+    with pytest.raises(ValueError):
+        scan(document, 1)
+
+
+def test_scan_max_value_size():
+    scanner = JsonKeyScanner("id", max_value_size=8)
+
+    with pytest.raises(ValueError):
+        scanner.feed(b'{"id": "' + b"x" * 16 + b'"}')
@@ -18,6 +18,8 @@ from stac_fastapi.static.core import (
     walk,
     walk_collections,
     walk_items,
+    WalkFilter,
+    make_filter_depth,
 )
 
 
@@ -155,3 +157,37 @@ def test_walk_items(catalog: pystac.Catalog, catalog_href: str, session):
         for item
         in items
     )
+
+
+def test_walk_lookahead(catalog: pystac.Catalog, catalog_href: str, session):
+    lookahead_settings = settings.model_copy(update={"walk_lookahead": 4})
+
+    walked_paths = [
+        link.walk_path
+        for link
+        in walk(file_path_to_file_uri(catalog_href), session=session, settings=settings)
+    ]
+
+    lookahead_walked_paths = [
+        link.walk_path
+        for link
+        in walk(file_path_to_file_uri(catalog_href), session=session, settings=lookahead_settings)
+    ]
+
+    assert lookahead_walked_paths == walked_paths
+
+    filtered_walk = WalkFilter(
+        walk(file_path_to_file_uri(catalog_href), session=session, settings=lookahead_settings),
+        make_filter_depth(depth=0)
+    )
+
+    assert [
+        walk_result.walk_path
+        for walk_result
+        in filtered_walk
+    ] == [
+        walk_path
+        for walk_path
+        in walked_paths
+        if len(walk_path) == 1
+    ]